@@ -1,22 +1,30 @@
-from NgSpyce.Editor.Elements.Nodal.nodal_element import NodalElement
-from NgSpyce.utilities import format_value as fv
+import re
+from typing import Optional
+
+from NgSpyce.Editor.Elements.Nodal.nodal_element import Node, NodalElement, _as_ic
+from NgSpyce.utilities import SpiceValue, format_value as fv
+
+# Leading "c =" / "q =" of a behavioral expression, and whether it is quoted
+_BEHAV_RE = re.compile(r"([cq])\s*=\s*(')?", re.IGNORECASE)
 
 class Capacitor(NodalElement):
+    __slots__ = ('m', 'scale', 'temp', 'dtemp', 'tc1', 'tc2', 'ic')
+
     def __init__(
         self,
-        name,
-        node1,
-        node2,
-        value=None,
-        mname=None,
-        m=None,
-        scale=None,
-        temp=None,
-        dtemp=None,
-        tc1=None,
-        tc2=None,
-        ic=None,
-    ):
+        name: str,
+        node1: Node,
+        node2: Node,
+        value: Optional[SpiceValue] = None,
+        mname: Optional[str] = None,
+        m: Optional[SpiceValue] = None,
+        scale: Optional[SpiceValue] = None,
+        temp: Optional[SpiceValue] = None,
+        dtemp: Optional[SpiceValue] = None,
+        tc1: Optional[SpiceValue] = None,
+        tc2: Optional[SpiceValue] = None,
+        ic: Optional[SpiceValue] = None,
+    ) -> None:
         """
         Initialize a 2-terminal Capacitor element for SPICE netlists.
 
@@ -34,13 +42,14 @@ class Capacitor(NodalElement):
             tc2 (Union[str, float], optional): Second-order temperature coefficient.
             ic (Union[str, float], optional): Initial capacitor voltage (IC=...).
         """
+        _fv = fv  # local lookup; called up to 8 times below
 
         if node1 is None or node2 is None:
             raise ValueError("Capacitor requires exactly two nodes: node1 and node2.")
 
         # Handle value or model usage
         if value:
-            main_value = fv(value)
+            main_value = _fv(value)
         elif mname:
             main_value = mname
         else:
@@ -49,44 +58,62 @@ class Capacitor(NodalElement):
         # Normalize two-node format for base class
         super().__init__(name, [node1, node2], main_value)
 
-        self.m = fv(m) if m is not None else None
-        self.scale = fv(scale) if scale is not None else None
-        self.temp = fv(temp) if temp is not None else None
-        self.dtemp = fv(dtemp) if dtemp is not None else None
-        self.tc1 = fv(tc1) if tc1 is not None else None
-        self.tc2 = fv(tc2) if tc2 is not None else None
-        self.ic = str(ic).strip() if ic is not None else None
+        self.m = _fv(m) if m is not None else None
+        self.scale = _fv(scale) if scale is not None else None
+        self.temp = _fv(temp) if temp is not None else None
+        self.dtemp = _fv(dtemp) if dtemp is not None else None
+        self.tc1 = _fv(tc1) if tc1 is not None else None
+        self.tc2 = _fv(tc2) if tc2 is not None else None
+        self.ic = _as_ic(ic) if ic is not None else None
 
-    def get_line(self) -> str:
+    @classmethod
+    def simple(cls, name: str, node1: Node, node2: Node, value: SpiceValue) -> "Capacitor":
         """
-        Generate the SPICE netlist line for the capacitor.
+        Build a plain "name node1 node2 value" capacitor without parsing the
+        optional keyword parameters (bulk loaders, generated netlists).
+
+        Args:
+            name (str): SPICE element name.
+            node1 (Union[str, int]): First terminal node.
+            node2 (Union[str, int]): Second terminal node.
+            value (Union[int, float, str]): Capacitance value in Farads.
 
         Returns:
-            str: SPICE-compatible element line.
+            Capacitor: Element equivalent to Capacitor(name, node1, node2, value).
         """
-        params = []
-
-        if self.m:     params.append(f"m={self.m}")
-        if self.scale: params.append(f"scale={self.scale}")
-        if self.temp:  params.append(f"temp={self.temp}")
-        if self.dtemp: params.append(f"dtemp={self.dtemp}")
-        if self.tc1:   params.append(f"tc1={self.tc1}")
-        if self.tc2:   params.append(f"tc2={self.tc2}")
-        if self.ic:    params.append(f"ic={self.ic}")
-
-        return ' '.join([self.name] + self.nodes + [self.value] + params)
+        if node1 is None or node2 is None:
+            raise ValueError("Capacitor requires exactly two nodes: node1 and node2.")
+        if not value:
+            raise ValueError("Capacitor requires either 'value' or 'mname'.")
+        obj = cls.__new__(cls)
+        NodalElement.__init__(obj, name, (node1, node2), fv(value))
+        obj.m = obj.scale = obj.temp = obj.dtemp = obj.tc1 = obj.tc2 = obj.ic = None
+        return obj
+
+    def _build_line(self) -> str:
+        parts = [self.name, self._nodes_str, self.value]
+        if self.m:     parts.append(f"m={self.m}")
+        if self.scale: parts.append(f"scale={self.scale}")
+        if self.temp:  parts.append(f"temp={self.temp}")
+        if self.dtemp: parts.append(f"dtemp={self.dtemp}")
+        if self.tc1:   parts.append(f"tc1={self.tc1}")
+        if self.tc2:   parts.append(f"tc2={self.tc2}")
+        if self.ic:    parts.append(f"ic={self.ic}")
+        return ' '.join(parts)
     
 class BehavioralCapacitor(NodalElement):
+    __slots__ = ('tc1', 'tc2')
+
     def __init__(
         self,
-        name,
-        node1,
-        node2,
-        expression,
-        kind='c',  # 'c' for capacitance, 'q' for charge
-        tc1=None,
-        tc2=None
-    ):
+        name: str,
+        node1: Node,
+        node2: Node,
+        expression: str,
+        kind: str = 'c',  # 'c' for capacitance, 'q' for charge
+        tc1: Optional[SpiceValue] = None,
+        tc2: Optional[SpiceValue] = None
+    ) -> None:
         """
         Behavioral capacitor supporting C or Q expressions.
 
@@ -103,51 +130,48 @@ class BehavioralCapacitor(NodalElement):
         """
         if node1 is None or node2 is None:
             raise ValueError("BehavioralCapacitor requires exactly two nodes.")
-        if kind.lower() not in ('c', 'q'):
+        kind = kind.lower()
+        if kind not in ('c', 'q'):
             raise ValueError("kind must be either 'c' (capacitance) or 'q' (charge)")
 
-        kind = kind.lower()
         expr = str(expression).strip()
 
-        # Add 'c =' or 'q =' if not explicitly provided
-        if not expr.startswith(("c =", "q =")):
+        # Add 'c =' or 'q =' if not explicitly provided, quote it if bare
+        match = _BEHAV_RE.match(expr)
+        if match is None:
             expr = f"{kind} = '{expr}'"
-        elif expr.startswith(f"{kind} =") and not expr.startswith(f"{kind} = '"):
-            expr = expr.replace(f"{kind} =", f"{kind} = '", 1).rstrip() + "'"
+        elif match.group(1).lower() == kind and not match.group(2):
+            expr = f"{kind} = '{expr[match.end():].rstrip()}'"
 
         super().__init__(name, [node1, node2], expr)
 
         self.tc1 = fv(tc1) if tc1 is not None else None
         self.tc2 = fv(tc2) if tc2 is not None else None
 
-    def get_line(self) -> str:
-        """
-        Generate the SPICE netlist line for a behavioral capacitor.
-
-        Returns:
-            str: SPICE-compatible capacitor definition line.
-        """
-        params = []
-        if self.tc1: params.append(f"tc1={self.tc1}")
-        if self.tc2: params.append(f"tc2={self.tc2}")
-        return ' '.join([self.name] + self.nodes + [self.value] + params)
+    def _build_line(self) -> str:
+        parts = [self.name, self._nodes_str, self.value]
+        if self.tc1: parts.append(f"tc1={self.tc1}")
+        if self.tc2: parts.append(f"tc2={self.tc2}")
+        return ' '.join(parts)
 
 class SemiconductorCapacitor(NodalElement):
+    __slots__ = ('l', 'w', 'm', 'scale', 'temp', 'dtemp', 'ic')
+
     def __init__(
         self,
-        name,
-        node1,
-        node2,
-        value=None,
-        mname=None,
-        l=None,
-        w=None,
-        m=None,
-        scale=None,
-        temp=None,
-        dtemp=None,
-        ic=None,
-    ):
+        name: str,
+        node1: Node,
+        node2: Node,
+        value: Optional[SpiceValue] = None,
+        mname: Optional[str] = None,
+        l: Optional[SpiceValue] = None,
+        w: Optional[SpiceValue] = None,
+        m: Optional[SpiceValue] = None,
+        scale: Optional[SpiceValue] = None,
+        temp: Optional[SpiceValue] = None,
+        dtemp: Optional[SpiceValue] = None,
+        ic: Optional[SpiceValue] = None,
+    ) -> None:
         """
         Initialize a semiconductor capacitor with geometric/model support.
 
@@ -165,12 +189,14 @@ class SemiconductorCapacitor(NodalElement):
             dtemp (Union[str, float], optional): Delta temperature.
             ic (Union[str, float], optional): Initial capacitor voltage (IC=...).
         """
+        _fv = fv  # local lookup; called up to 8 times below
+
         if node1 is None or node2 is None:
             raise ValueError("SemiconductorCapacitor requires two valid nodes.")
 
         # Determine what gets placed in the main netlist position
         if value is not None:
-            main_value = fv(value)
+            main_value = _fv(value)
         elif mname is not None:
             main_value = mname
         else:
@@ -178,32 +204,24 @@ class SemiconductorCapacitor(NodalElement):
 
         super().__init__(name, [node1, node2], main_value)
 
-        self.l = fv(l) if l is not None else None
-        self.w = fv(w) if w is not None else None
-        self.m = fv(m) if m is not None else None
-        self.scale = fv(scale) if scale is not None else None
-        self.temp = fv(temp) if temp is not None else None
-        self.dtemp = fv(dtemp) if dtemp is not None else None
-        self.ic = f"{ic}".strip() if ic is not None else None
-
-    def get_line(self) -> str:
-        """
-        Generate SPICE netlist line for a semiconductor capacitor.
-
-        Returns:
-            str: SPICE-compatible capacitor definition line.
-        """
-        params = []
-
-        if self.l:     params.append(f"L={self.l}")
-        if self.w:     params.append(f"W={self.w}")
-        if self.m:     params.append(f"m={self.m}")
-        if self.scale: params.append(f"scale={self.scale}")
-        if self.temp:  params.append(f"temp={self.temp}")
-        if self.dtemp: params.append(f"dtemp={self.dtemp}")
-        if self.ic:    params.append(f"ic={self.ic}")
-
-        return ' '.join([self.name] + self.nodes + [self.value] + params)
+        self.l = _fv(l) if l is not None else None
+        self.w = _fv(w) if w is not None else None
+        self.m = _fv(m) if m is not None else None
+        self.scale = _fv(scale) if scale is not None else None
+        self.temp = _fv(temp) if temp is not None else None
+        self.dtemp = _fv(dtemp) if dtemp is not None else None
+        self.ic = _as_ic(ic) if ic is not None else None
+
+    def _build_line(self) -> str:
+        parts = [self.name, self._nodes_str, self.value]
+        if self.l:     parts.append(f"L={self.l}")
+        if self.w:     parts.append(f"W={self.w}")
+        if self.m:     parts.append(f"m={self.m}")
+        if self.scale: parts.append(f"scale={self.scale}")
+        if self.temp:  parts.append(f"temp={self.temp}")
+        if self.dtemp: parts.append(f"dtemp={self.dtemp}")
+        if self.ic:    parts.append(f"ic={self.ic}")
+        return ' '.join(parts)
     
 if __name__ == '__main__':
     print(Capacitor("C1", 1, 2, "1u").get_line())
@@ -1,13 +1,19 @@
+from typing import Optional, TextIO
+
+from NgSpyce.Editor.Elements.Nodal.nodal_element import Node
+
 class CurrentControlledSwitch:
+    __slots__ = ('name', 'nodes', 'vsource_name', 'model', '_state', '_state_suffix')
+
     def __init__(
         self,
         name: str,
-        node1,
-        node2,
+        node1: Node,
+        node2: Node,
         vsource_name: str,
         model: str,
-        state: str = None  # 'ON' or 'OFF'
-    ):
+        state: Optional[str] = None  # 'ON' or 'OFF'
+    ) -> None:
         """
         Current-controlled switch.
 
@@ -19,21 +25,35 @@ class CurrentControlledSwitch:
             state (str, optional): Initial switch state: 'ON' or 'OFF'
         """
         self.name = name
-        self.nodes = [str(node1), str(node2)]
+        self.nodes = (str(node1), str(node2))
         self.vsource_name = vsource_name
         self.model = model
-        self.state = state.upper() if state else None
-        if self.state not in (None, "ON", "OFF"):
+        self.state = state
+
+    @property
+    def state(self) -> Optional[str]:
+        return self._state
+
+    @state.setter
+    def state(self, state: Optional[str]) -> None:
+        state = state.upper() if state else None
+        if state not in (None, "ON", "OFF"):
             raise ValueError("Switch state must be 'ON', 'OFF', or None")
+        self._state = state
+        # Precomputed so get_line needs no branch on the state
+        self._state_suffix = f" {state}" if state else ""
+
+    def get_line(self) -> str:
+        return f"{self.name} {self.nodes[0]} {self.nodes[1]} {self.vsource_name} {self.model}{self._state_suffix}"
 
-    def get_line(self):
-        parts = [self.name] + self.nodes + [self.vsource_name, self.model]
-        if self.state:
-            parts.append(self.state.upper())
-        return ' '.join(parts)
+    def write_to(self, buf: TextIO) -> None:
+        buf.write(self.get_line())
 
 if __name__ == '__main__':
     w1 = CurrentControlledSwitch("W1", 40, 0, "vm3", "wswitch1", state="ON")
     print(w1.get_line())
     w1.state = 'off'
     print(w1.get_line())
+    w2 = CurrentControlledSwitch("W2", 41, 0, "vm3", "wswitch1", state="on")
+    print(w2.get_line())
+    # W2 41 0 vm3 wswitch1 ON
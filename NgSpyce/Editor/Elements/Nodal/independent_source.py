@@ -1,19 +1,31 @@
-from NgSpyce.Editor.Elements.Nodal.nodal_element import NodalElement
-from NgSpyce.utilities import format_value as fv
+from typing import Optional, Sequence, Union
+
+from NgSpyce.Editor.Elements.Nodal.nodal_element import Node, NodalElement
+from NgSpyce.utilities import SpiceValue, format_value as fv
+
+def _distortion_part(tag: str, value: Union[bool, Sequence[SpiceValue]]) -> Optional[str]:
+    # A DISTOF argument as netlist text: the bare tag, "tag mag phase", or None
+    if value is True:
+        return tag
+    if isinstance(value, (tuple, list)) and len(value) >= 1:
+        return f"{tag} {fv(value[0])} {fv(value[1]) if len(value) > 1 else '0'}"
+    return None
 
 class IndependentSource(NodalElement):
+    __slots__ = ('dc_value', 'waveform', 'ac_mag', 'ac_phase', 'distof1', 'distof2')
+
     def __init__(
         self,
         name: str,
-        node1,
-        node2,
-        dc_value=None,
-        waveform=None,          # e.g., "SIN(0 1 1MEG)", "PWL(0 0 1u 1)", etc.
-        ac_mag=None,
-        ac_phase=None,
-        distof1=None,           # Can be True or (mag, phase)
-        distof2=None,           # Same
-    ):
+        node1: Node,
+        node2: Node,
+        dc_value: Optional[SpiceValue] = None,
+        waveform: Optional[str] = None,  # e.g., "SIN(0 1 1MEG)", "PWL(0 0 1u 1)", etc.
+        ac_mag: Optional[SpiceValue] = None,
+        ac_phase: Optional[SpiceValue] = None,
+        distof1: Optional[Union[bool, Sequence[SpiceValue]]] = None,  # Can be True or (mag, phase)
+        distof2: Optional[Union[bool, Sequence[SpiceValue]]] = None,  # Same
+    ) -> None:
         """
         General independent voltage or current source for Ngspice.
 
@@ -36,73 +48,68 @@ class IndependentSource(NodalElement):
         self.distof1 = distof1
         self.distof2 = distof2
 
-    def _render_distortion(self, tag, value):
-        if value is True:
-            return tag
-        elif isinstance(value, (tuple, list)) and len(value) >= 1:
-            mag = fv(value[0])
-            phase = fv(value[1]) if len(value) > 1 else "0"
-            return f"{tag} {mag} {phase}"
-        return None
-
-    def get_line(self):
-        parts = [self.name] + self.nodes
+    def _build_line(self) -> str:
+        # Values go through f-strings so a field reassigned after construction
+        # with a bare number (src.dc_value = 5) still renders
+        parts = [self.name, self._nodes_str]
 
         # DC / TRAN / waveform
         if self.waveform:
             if self.dc_value:  # DC prefix only if value is given
-                parts += ['DC', self.dc_value, self.waveform]
-            else:
-                parts.append(self.waveform)
+                parts.append(f"DC {self.dc_value}")
+            parts.append(f"{self.waveform}")
         elif self.dc_value is not None:
-            parts += ['DC', self.dc_value]
+            parts.append(f"DC {self.dc_value}")
 
         # AC
         if self.ac_mag:
-            ac_part = ["AC", self.ac_mag]
-            if self.ac_phase:
-                ac_part.append(self.ac_phase)
-            parts += ac_part
+            parts.append(f"AC {self.ac_mag} {self.ac_phase}" if self.ac_phase else f"AC {self.ac_mag}")
 
-        # DISTO
-        d1 = self._render_distortion("DISTOF1", self.distof1)
-        d2 = self._render_distortion("DISTOF2", self.distof2)
-        if d1: parts.append(d1)
-        if d2: parts.append(d2)
+        # DISTO: formatted here rather than in __init__, so a reassigned
+        # (mag,) or (mag, phase) spec is normalized too
+        for tag, spec in (("DISTOF1", self.distof1), ("DISTOF2", self.distof2)):
+            if spec:
+                part = _distortion_part(tag, spec)
+                if part:
+                    parts.append(part)
 
-        return ' '.join(str(p) for p in parts)
+        return ' '.join(parts)
     
 class VoltageSource(IndependentSource):
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
-        node1,
-        node2,
-        dc_value=None,
-        waveform=None,
-        ac_mag=None,
-        ac_phase=None,
-        distof1=None,
-        distof2=None,
-    ):
-        if not name.upper().startswith("V"):
+        node1: Node,
+        node2: Node,
+        dc_value: Optional[SpiceValue] = None,
+        waveform: Optional[str] = None,
+        ac_mag: Optional[SpiceValue] = None,
+        ac_phase: Optional[SpiceValue] = None,
+        distof1: Optional[Union[bool, Sequence[SpiceValue]]] = None,
+        distof2: Optional[Union[bool, Sequence[SpiceValue]]] = None,
+    ) -> None:
+        if not name or name[0] not in ('V', 'v'):
             raise ValueError("VoltageSource name must begin with 'V'")
         super().__init__(name, node1, node2, dc_value, waveform, ac_mag, ac_phase, distof1, distof2)
         
 class CurrentSource(IndependentSource):
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
-        node1,
-        node2,
-        dc_value=None,
-        waveform=None,
-        ac_mag=None,
-        ac_phase=None,
-        distof1=None,
-        distof2=None,
-    ):
-        if not name.upper().startswith("I"):
+        node1: Node,
+        node2: Node,
+        dc_value: Optional[SpiceValue] = None,
+        waveform: Optional[str] = None,
+        ac_mag: Optional[SpiceValue] = None,
+        ac_phase: Optional[SpiceValue] = None,
+        distof1: Optional[Union[bool, Sequence[SpiceValue]]] = None,
+        distof2: Optional[Union[bool, Sequence[SpiceValue]]] = None,
+    ) -> None:
+        if not name or name[0] not in ('I', 'i'):
             raise ValueError("CurrentSource name must begin with 'I'")
         super().__init__(name, node1, node2, dc_value, waveform, ac_mag, ac_phase, distof1, distof2)
     
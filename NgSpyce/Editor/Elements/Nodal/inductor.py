@@ -1,23 +1,31 @@
-from NgSpyce.Editor.Elements.Nodal.nodal_element import NodalElement
-from NgSpyce.utilities import format_value as fv
+import re
+from typing import Optional, TextIO
+
+from NgSpyce.Editor.Elements.Nodal.nodal_element import Node, NodalElement, _as_ic
+from NgSpyce.utilities import SpiceValue, format_value as fv
+
+# Leading "L =" of a behavioral expression, and whether it is quoted
+_BEHAV_RE = re.compile(r"l\s*=\s*(')?", re.IGNORECASE)
 
 class Inductor(NodalElement):
+    __slots__ = ('nt', 'm', 'scale', 'temp', 'dtemp', 'tc1', 'tc2', 'ic')
+
     def __init__(
         self,
-        name,
-        node1,
-        node2,
-        value=None,
-        mname=None,
-        nt=None,
-        m=None,
-        scale=None,
-        temp=None,
-        dtemp=None,
-        tc1=None,
-        tc2=None,
-        ic=None
-    ):
+        name: str,
+        node1: Node,
+        node2: Node,
+        value: Optional[SpiceValue] = None,
+        mname: Optional[str] = None,
+        nt: Optional[SpiceValue] = None,
+        m: Optional[SpiceValue] = None,
+        scale: Optional[SpiceValue] = None,
+        temp: Optional[SpiceValue] = None,
+        dtemp: Optional[SpiceValue] = None,
+        tc1: Optional[SpiceValue] = None,
+        tc2: Optional[SpiceValue] = None,
+        ic: Optional[SpiceValue] = None
+    ) -> None:
         """
         Initialize a 2-terminal inductor element for SPICE netlists.
 
@@ -36,12 +44,14 @@ class Inductor(NodalElement):
             tc2 (Union[float, str], optional): Second-order temperature coefficient.
             ic (Union[float, str], optional): Initial current (IC=...) in Amps.
         """
+        _fv = fv  # local lookup; called up to 8 times below
+
         if node1 is None or node2 is None:
             raise ValueError("Inductor requires two valid node identifiers.")
 
         # Primary element line value (either direct or model)
         if value is not None:
-            main_value = fv(value)
+            main_value = _fv(value)
         elif mname is not None:
             main_value = mname
         else:
@@ -49,45 +59,63 @@ class Inductor(NodalElement):
 
         super().__init__(name, [node1, node2], main_value)
 
-        self.nt = fv(nt) if nt is not None else None
-        self.m = fv(m) if m is not None else None
-        self.scale = fv(scale) if scale is not None else None
-        self.temp = fv(temp) if temp is not None else None
-        self.dtemp = fv(dtemp) if dtemp is not None else None
-        self.tc1 = fv(tc1) if tc1 is not None else None
-        self.tc2 = fv(tc2) if tc2 is not None else None
-        self.ic = f"{ic}".strip() if ic is not None else None
-
-    def get_line(self) -> str:
+        self.nt = _fv(nt) if nt is not None else None
+        self.m = _fv(m) if m is not None else None
+        self.scale = _fv(scale) if scale is not None else None
+        self.temp = _fv(temp) if temp is not None else None
+        self.dtemp = _fv(dtemp) if dtemp is not None else None
+        self.tc1 = _fv(tc1) if tc1 is not None else None
+        self.tc2 = _fv(tc2) if tc2 is not None else None
+        self.ic = _as_ic(ic) if ic is not None else None
+
+    @classmethod
+    def simple(cls, name: str, node1: Node, node2: Node, value: SpiceValue) -> "Inductor":
         """
-        Generate the SPICE netlist line for the inductor.
+        Build a plain "name node1 node2 value" inductor without parsing the
+        optional keyword parameters (bulk loaders, generated netlists).
+
+        Args:
+            name (str): SPICE element name.
+            node1 (Union[str, int]): First terminal node.
+            node2 (Union[str, int]): Second terminal node.
+            value (Union[int, float, str]): Inductance in Henry.
 
         Returns:
-            str: SPICE-compatible inductor definition line.
+            Inductor: Element equivalent to Inductor(name, node1, node2, value).
         """
-        params = []
-
-        if self.nt:    params.append(f"nt={self.nt}")
-        if self.m:     params.append(f"m={self.m}")
-        if self.scale: params.append(f"scale={self.scale}")
-        if self.temp:  params.append(f"temp={self.temp}")
-        if self.dtemp: params.append(f"dtemp={self.dtemp}")
-        if self.tc1:   params.append(f"tc1={self.tc1}")
-        if self.tc2:   params.append(f"tc2={self.tc2}")
-        if self.ic:    params.append(f"ic={self.ic}")
-
-        return ' '.join([self.name] + self.nodes + [self.value] + params)
+        if node1 is None or node2 is None:
+            raise ValueError("Inductor requires two valid node identifiers.")
+        if value is None:
+            raise ValueError("Must specify either 'value' or 'mname'.")
+        obj = cls.__new__(cls)
+        NodalElement.__init__(obj, name, (node1, node2), fv(value))
+        obj.nt = obj.m = obj.scale = obj.temp = obj.dtemp = obj.tc1 = obj.tc2 = obj.ic = None
+        return obj
+
+    def _build_line(self) -> str:
+        parts = [self.name, self._nodes_str, self.value]
+        if self.nt:    parts.append(f"nt={self.nt}")
+        if self.m:     parts.append(f"m={self.m}")
+        if self.scale: parts.append(f"scale={self.scale}")
+        if self.temp:  parts.append(f"temp={self.temp}")
+        if self.dtemp: parts.append(f"dtemp={self.dtemp}")
+        if self.tc1:   parts.append(f"tc1={self.tc1}")
+        if self.tc2:   parts.append(f"tc2={self.tc2}")
+        if self.ic:    parts.append(f"ic={self.ic}")
+        return ' '.join(parts)
 
 class BehavioralInductor(NodalElement):
+    __slots__ = ('tc1', 'tc2')
+
     def __init__(
         self,
         name: str,
-        node1,
-        node2,
+        node1: Node,
+        node2: Node,
         expression: str,
-        tc1=None,
-        tc2=None
-    ):
+        tc1: Optional[SpiceValue] = None,
+        tc2: Optional[SpiceValue] = None
+    ) -> None:
         """
         Behavioral inductor dependent on a dynamic expression.
 
@@ -106,30 +134,28 @@ class BehavioralInductor(NodalElement):
 
         expr = str(expression).strip()
 
-        if not expr.startswith("L =") and not expr.startswith("'") and not expr.startswith('"'):
-            expr = f"L = '{expr}'"
-        elif expr.startswith("L =") and not expr.startswith("L = '"):
-            expr = expr.replace("L =", "L = '", 1).rstrip() + "'"
+        match = _BEHAV_RE.match(expr)
+        if match is None:
+            if not expr.startswith(("'", '"')):
+                expr = f"L = '{expr}'"
+        elif not match.group(1):
+            expr = f"L = '{expr[match.end():].rstrip()}'"
 
         super().__init__(name, [node1, node2], expr)
 
         self.tc1 = fv(tc1) if tc1 is not None else None
         self.tc2 = fv(tc2) if tc2 is not None else None
 
-    def get_line(self) -> str:
-        """
-        Generate SPICE netlist line for behavioral inductor.
-
-        Returns:
-            str: Netlist line, e.g., "L1 n1 n2 L = 'i(Vm) < {It} ? {Ll} : {Lh}' tc1=..."
-        """
-        params = []
-        if self.tc1: params.append(f"tc1={self.tc1}")
-        if self.tc2: params.append(f"tc2={self.tc2}")
-        return ' '.join([self.name] + self.nodes + [self.value] + params)
+    def _build_line(self) -> str:
+        parts = [self.name, self._nodes_str, self.value]
+        if self.tc1: parts.append(f"tc1={self.tc1}")
+        if self.tc2: parts.append(f"tc2={self.tc2}")
+        return ' '.join(parts)
     
 class MutualInductor:
-    def __init__(self, name: str, inductor1: Inductor, inductor2: Inductor, coupling: float):
+    __slots__ = ('name', 'ind1_name', 'ind2_name', 'coupling')
+
+    def __init__(self, name: str, inductor1: Inductor, inductor2: Inductor, coupling: float) -> None:
         """
         Define pairwise mutual inductance between two inductors.
 
@@ -145,16 +171,20 @@ class MutualInductor:
         self.name = name
         self.ind1_name = inductor1.name
         self.ind2_name = inductor2.name
-        self.coupling = fv(coupling)
+        # Already validated as a number in (0, 1]; no SPICE suffix parsing needed
+        self.coupling = format(coupling, 'g') if isinstance(coupling, float) else fv(coupling)
 
     def get_line(self) -> str:
         """
-        Generate the SPICE netlist line for the coupled inductors.
+        Return the SPICE netlist line for the coupled inductors.
 
         Returns:
             str: Netlist line, e.g. 'K12 L1 L2 0.98'
         """
         return f"{self.name} {self.ind1_name} {self.ind2_name} {self.coupling}"
+
+    def write_to(self, buf: TextIO) -> None:
+        buf.write(self.get_line())
     
 if __name__ == '__main__':
     print(Inductor("LLINK", 42, 69, "1u").get_line())
@@ -1,17 +1,25 @@
-from NgSpyce.Editor.Elements.Nodal.nodal_element import NodalElement
-from NgSpyce.utilities import format_value as fv
+import sys
+from typing import List, Optional, Sequence
+
+from NgSpyce.Editor.Elements.Nodal.nodal_element import Node, NodalElement
+from NgSpyce.utilities import SpiceValue, format_value as fv
+
+# Shared "POLY(n)" tokens for the usual polynomial dimensions
+_POLY = {n: sys.intern(f"POLY({n})") for n in range(1, 17)}
 
 class VoltagrControlledCurrentSource(NodalElement):
+    __slots__ = ('m',)
+
     def __init__(
         self,
         name: str,
-        out_pos,
-        out_neg,
-        ctrl_pos,
-        ctrl_neg,
-        value,
-        m=None
-    ):
+        out_pos: Node,
+        out_neg: Node,
+        ctrl_pos: Node,
+        ctrl_neg: Node,
+        value: SpiceValue,
+        m: Optional[SpiceValue] = None
+    ) -> None:
         """
         Create a Voltage-Controlled Current Source (Gxxxx) element.
 
@@ -28,15 +36,15 @@ class VoltagrControlledCurrentSource(NodalElement):
         super().__init__(name, [out_pos, out_neg, ctrl_pos, ctrl_neg], formatted_value)
         self.m = fv(m) if m is not None else None
 
-    def get_line(self) -> str:
-        """Return SPICE netlist line for VCCS"""
-        line = ' '.join([self.name] + self.nodes + [self.value])
-        if self.m:
-            line += f" m={self.m}"
-        return line
+    def _build_line(self) -> str:
+        parts = [self.name, self._nodes_str, self.value]
+        if self.m: parts.append(f"m={self.m}")
+        return ' '.join(parts)
     
 class VoltageControlledVoltageSource(NodalElement):
-    def __init__(self, name, out_pos, out_neg, ctrl_pos, ctrl_neg, gain):
+    __slots__ = ()
+
+    def __init__(self, name: str, out_pos: Node, out_neg: Node, ctrl_pos: Node, ctrl_neg: Node, gain: SpiceValue) -> None:
         """
         Voltage-Controlled Voltage Source (E).
         Args:
@@ -47,12 +55,11 @@ class VoltageControlledVoltageSource(NodalElement):
         """
         value = fv(gain)
         super().__init__(name, [out_pos, out_neg, ctrl_pos, ctrl_neg], value)
-
-    def get_line(self) -> str:
-        return ' '.join([self.name] + self.nodes + [self.value])
     
 class CurrentControlledCurrentSource(NodalElement):
-    def __init__(self, name, out_pos, out_neg, vname, gain, m=None):
+    __slots__ = ('m',)
+
+    def __init__(self, name: str, out_pos: Node, out_neg: Node, vname: str, gain: SpiceValue, m: Optional[SpiceValue] = None) -> None:
         """
         Current-Controlled Current Source (F).
         Args:
@@ -64,14 +71,15 @@ class CurrentControlledCurrentSource(NodalElement):
         super().__init__(name, [out_pos, out_neg, vname], value)
         self.m = fv(m) if m is not None else None
 
-    def get_line(self) -> str:
-        line = ' '.join([self.name] + self.nodes + [self.value])
-        if self.m:
-            line += f" m={self.m}"
-        return line
+    def _build_line(self) -> str:
+        parts = [self.name, self._nodes_str, self.value]
+        if self.m: parts.append(f"m={self.m}")
+        return ' '.join(parts)
     
 class CurrentControlledVoltageSource(NodalElement):
-    def __init__(self, name, out_pos, out_neg, vname, gain):
+    __slots__ = ()
+
+    def __init__(self, name: str, out_pos: Node, out_neg: Node, vname: str, gain: SpiceValue) -> None:
         """
         Current-Controlled Voltage Source (H).
         Args:
@@ -79,12 +87,11 @@ class CurrentControlledVoltageSource(NodalElement):
         """
         value = fv(gain)
         super().__init__(name, [out_pos, out_neg, vname], value)
-
-    def get_line(self) -> str:
-        return ' '.join([self.name] + self.nodes + [self.value])
     
 class PolynomialSource(NodalElement):
-    def __init__(self, name, source_type, out_pos, out_neg, control_nodes, coeffs):
+    __slots__ = ()
+
+    def __init__(self, name: str, source_type: str, out_pos: Node, out_neg: Node, control_nodes: List[Node], coeffs: Sequence[SpiceValue]) -> None:
         """
         Generic POLY dependent source.
 
@@ -94,13 +101,10 @@ class PolynomialSource(NodalElement):
             coeffs: list of polynomial coefficients
         """
         poly_order = len(control_nodes) // 2 if source_type in ('E', 'G') else len(control_nodes)
-        poly_str = f"POLY({poly_order})"
-        value_str = ' '.join(str(fv(c)) for c in coeffs)
+        poly_str = _POLY.get(poly_order) or f"POLY({poly_order})"
+        value_str = ' '.join(fv(c) for c in coeffs)
         nodes = [out_pos, out_neg] + control_nodes
         super().__init__(name, nodes, f"{poly_str} {value_str}")
-
-    def get_line(self):
-        return ' '.join([self.name] + self.nodes + [self.value])
     
 if __name__ == '__main__':
     g1 = VoltagrControlledCurrentSource("G1", 2, 0, 5, 0, "0.1")
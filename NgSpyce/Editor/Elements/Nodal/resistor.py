@@ -1,7 +1,17 @@
+import re
+
 from NgSpyce.Editor.Elements.Nodal.nodal_element import NodalElement
 from NgSpyce.utilities import format_value as fv
 
+# Leading "r =" of a behavioral expression, and whether it is quoted
+_BEHAV_RE = re.compile(r"r\s*=\s*(')?", re.IGNORECASE)
+
+# Resistance strings treated as a 0-ohm short (replaced by 1p)
+_ZERO_STRS = frozenset(("0", "0.0"))
+
 class Resistor(NodalElement):
+    __slots__ = ('ac', 'm', 'scale', 'temp', 'dtemp', 'tc1', 'tc2', 'tce', 'noisy')
+
     def __init__(
         self,
         name,
@@ -33,9 +43,7 @@ class Resistor(NodalElement):
             raise ValueError("Resistor requires exactly two nodes: node1 and node2.")
 
         # Handle 0-ohm override
-        if isinstance(value, (int, float)) and value == 0:
-            value = 1e-12
-        elif isinstance(value, str) and value.strip() in ["0", "0.0"]:
+        if (isinstance(value, (int, float)) and value == 0) or (isinstance(value, str) and value.strip() in _ZERO_STRS):
             value = "1p"
 
         formatted_value = fv(value)
@@ -51,29 +59,24 @@ class Resistor(NodalElement):
         self.tc1 = fv(tc1) if tc1 is not None else None
         self.tc2 = fv(tc2) if tc2 is not None else None
         self.tce = fv(tce) if tce is not None else None
-        self.noisy = str(int(bool(noisy))) if noisy is not None else None
-
-    def get_line(self) -> str:
-        """_summary_
-
-        Returns:
-            str: _description_
-        """
-        params = []
-
-        if self.ac:    params.append(f"ac={self.ac}")
-        if self.m:     params.append(f"m={self.m}")
-        if self.scale: params.append(f"scale={self.scale}")
-        if self.temp:  params.append(f"temp={self.temp}")
-        if self.dtemp: params.append(f"dtemp={self.dtemp}")
-        if self.tc1:   params.append(f"tc1={self.tc1}")
-        if self.tc2:   params.append(f"tc2={self.tc2}")
-        if self.tce:   params.append(f"tce={self.tce}")
-        if self.noisy: params.append(f"noisy={self.noisy}")
-
-        return ' '.join([self.name] + self.nodes + [self.value] + params)
+        self.noisy = ("0", "1")[bool(noisy)] if noisy is not None else None
+
+    def _build_line(self) -> str:
+        parts = [self.name, self._nodes_str, self.value]
+        if self.ac:    parts.append(f"ac={self.ac}")
+        if self.m:     parts.append(f"m={self.m}")
+        if self.scale: parts.append(f"scale={self.scale}")
+        if self.temp:  parts.append(f"temp={self.temp}")
+        if self.dtemp: parts.append(f"dtemp={self.dtemp}")
+        if self.tc1:   parts.append(f"tc1={self.tc1}")
+        if self.tc2:   parts.append(f"tc2={self.tc2}")
+        if self.tce:   parts.append(f"tce={self.tce}")
+        if self.noisy: parts.append(f"noisy={self.noisy}")
+        return ' '.join(parts)
     
 class BehavioralResistor(NodalElement):
+    __slots__ = ('tc1', 'tc2', 'noisy')
+
     def __init__(
         self,
         name,
@@ -104,33 +107,30 @@ class BehavioralResistor(NodalElement):
 
         # Normalize expression
         expr = str(expression).strip()
-        if not expr.startswith('r =') and not expr.startswith("'") and not expr.startswith('"'):
-            expr = f"r = '{expr}'"
-        elif expr.startswith('r =') and not expr.startswith("r = '"):
+        match = _BEHAV_RE.match(expr)
+        if match is None:
+            if not expr.startswith(("'", '"')):
+                expr = f"r = '{expr}'"
+        elif not match.group(1):
             # ensure quoted after r =
-            expr = expr.replace('r =', "r = '", 1).rstrip() + "'"
+            expr = f"r = '{expr[match.end():].rstrip()}'"
 
         super().__init__(name, [node1, node2], expr)
 
         self.tc1 = fv(tc1) if tc1 is not None else None
         self.tc2 = fv(tc2) if tc2 is not None else None
-        self.noisy = str(int(bool(noisy))) if noisy is not None else None
-
-    def get_line(self) -> str:
-        """
-        Generate the ngspice netlist line for a behavioral resistor.
-
-        Returns:
-            str: Full SPICE netlist line
-        """
-        params = []
-        if self.tc1: params.append(f"tc1={self.tc1}")
-        if self.tc2: params.append(f"tc2={self.tc2}")
-        if self.noisy: params.append(f"noisy={self.noisy}")
-
-        return ' '.join([self.name] + self.nodes + [self.value] + params)
+        self.noisy = ("0", "1")[bool(noisy)] if noisy is not None else None
+
+    def _build_line(self) -> str:
+        parts = [self.name, self._nodes_str, self.value]
+        if self.tc1:   parts.append(f"tc1={self.tc1}")
+        if self.tc2:   parts.append(f"tc2={self.tc2}")
+        if self.noisy: parts.append(f"noisy={self.noisy}")
+        return ' '.join(parts)
     
 class SemiconductorResistor(NodalElement):
+    __slots__ = ('l', 'w', 'temp', 'dtemp', 'm', 'ac', 'scale', 'noisy')
+
     def __init__(
         self,
         name,
@@ -187,27 +187,19 @@ class SemiconductorResistor(NodalElement):
         self.m = fv(m) if m is not None else None
         self.ac = fv(ac) if ac is not None else None
         self.scale = fv(scale) if scale is not None else None
-        self.noisy = str(int(bool(noisy))) if noisy is not None else None
-
-    def get_line(self) -> str:
-        """
-        Generate SPICE netlist line for semiconductor resistor.
-
-        Returns:
-            str: SPICE-compatible resistor line with model or geometry.
-        """
-        params = []
-
-        if self.l:     params.append(f"L={self.l}")
-        if self.w:     params.append(f"W={self.w}")
-        if self.temp:  params.append(f"temp={self.temp}")
-        if self.dtemp: params.append(f"dtemp={self.dtemp}")
-        if self.m:     params.append(f"m={self.m}")
-        if self.ac:    params.append(f"ac={self.ac}")
-        if self.scale: params.append(f"scale={self.scale}")
-        if self.noisy: params.append(f"noisy={self.noisy}")
-
-        return ' '.join([self.name] + self.nodes + [self.value] + params)
+        self.noisy = ("0", "1")[bool(noisy)] if noisy is not None else None
+
+    def _build_line(self) -> str:
+        parts = [self.name, self._nodes_str, self.value]
+        if self.l:     parts.append(f"L={self.l}")
+        if self.w:     parts.append(f"W={self.w}")
+        if self.temp:  parts.append(f"temp={self.temp}")
+        if self.dtemp: parts.append(f"dtemp={self.dtemp}")
+        if self.m:     parts.append(f"m={self.m}")
+        if self.ac:    parts.append(f"ac={self.ac}")
+        if self.scale: parts.append(f"scale={self.scale}")
+        if self.noisy: parts.append(f"noisy={self.noisy}")
+        return ' '.join(parts)
         
 if __name__ == '__main__':
     print(Resistor('R1', 1, 2, 1_000_000).get_line())
@@ -1,6 +1,19 @@
 from NgSpyce.utilities import format_value as fv
 
-class Pulse:
+class _Waveform:
+    # Same contract as NodalElement.get_line(): each subclass renders its text
+    # once through _render(); after editing a field, reset _cached_str = None.
+    __slots__ = ('_cached_str',)
+
+    def __str__(self) -> str:
+        text = self._cached_str
+        if text is None:
+            text = self._cached_str = self._render()
+        return text
+
+class Pulse(_Waveform):
+    __slots__ = ('v1', 'v2', 'td', 'tr', 'tf', 'pw', 'per', 'np')
+
     def __init__(
         self,
         v1,              # Initial value (V or A)
@@ -27,24 +40,26 @@ class Pulse:
         """
         self.v1 = fv(v1)
         self.v2 = fv(v2)
-        self.td = fv(td)
+        self.td = "0" if td == 0 else fv(td)  # skip fv for the default
         self.tr = fv(tr) if tr is not None else None
         self.tf = fv(tf) if tf is not None else None
         self.pw = fv(pw) if pw is not None else None
         self.per = fv(per) if per is not None else None
         self.np = str(np) if isinstance(np, int) and np > 0 else None
+        self._cached_str = None
 
-    def __str__(self):
-        parts = ["PULSE(" + self.v1, self.v2, self.td]
+    def _render(self) -> str:
+        optional = (self.tr, self.tf, self.pw, self.per, self.np)
+        if None not in optional:
+            # Complete form: every field present, no filtering needed
+            return f"PULSE({self.v1} {self.v2} {self.td} {self.tr} {self.tf} {self.pw} {self.per} {self.np})"
 
         # Ensure parameters are added in order and grouped
-        for val in [self.tr, self.tf, self.pw, self.per, self.np]:
-            if val is not None:
-                parts.append(val)
-
-        return ' '.join(parts) + ")"
+        parts = ' '.join([val for val in (self.v1, self.v2, self.td, *optional) if val is not None])
+        return f"PULSE({parts})"
     
-class Sin:
+class Sin(_Waveform):
+    __slots__ = ('v0', 'va', 'freq', 'td', 'theta', 'phase')
     def __init__(
         self,
         v0,             # Offset (V or A)
@@ -68,14 +83,17 @@ class Sin:
         self.v0 = fv(v0)
         self.va = fv(va)
         self.freq = fv(freq)
-        self.td = fv(td)
-        self.theta = fv(theta)
-        self.phase = fv(phase)
+        self.td = "0" if td == 0 else fv(td)
+        self.theta = "0" if theta == 0 else fv(theta)
+        self.phase = "0" if phase == 0 else fv(phase)
+        self._cached_str = None
 
-    def __str__(self):
+    def _render(self) -> str:
         return f"SIN({self.v0} {self.va} {self.freq} {self.td} {self.theta} {self.phase})"
     
-class Exponential:
+class Exponential(_Waveform):
+    __slots__ = ('v1', 'v2', 'td1', 'tau1', 'td2', 'tau2')
+
     def __init__(
         self,
         v1,       # Initial value (V or A)
@@ -98,21 +116,23 @@ class Exponential:
         """
         self.v1 = fv(v1)
         self.v2 = fv(v2)
-        self.td1 = fv(td1)
+        self.td1 = "0" if td1 == 0 else fv(td1)
         self.tau1 = fv(tau1) if tau1 is not None else None
         self.td2 = fv(td2) if td2 is not None else None
         self.tau2 = fv(tau2) if tau2 is not None else None
+        self._cached_str = None
 
-    def __str__(self):
-        parts = [self.v1, self.v2, self.td1]
+    def _render(self) -> str:
+        optional = (self.tau1, self.td2, self.tau2)
+        if None not in optional:
+            return f"Exponential({self.v1} {self.v2} {self.td1} {self.tau1} {self.td2} {self.tau2})"
 
         # Require remaining values in correct order
-        if self.tau1 is not None: parts.append(self.tau1)
-        if self.td2 is not None:  parts.append(self.td2)
-        if self.tau2 is not None: parts.append(self.tau2)
+        parts = ' '.join([val for val in (self.v1, self.v2, self.td1, *optional) if val is not None])
+        return f"Exponential({parts})"
 
-        return "Exponential(" + ' '.join(parts) + ")"
-class PieceWiseLinear:
+class PieceWiseLinear(_Waveform):
+    __slots__ = ('points', 'r', 'td')
     def __init__(
         self,
         *points,        # (T1, V1, T2, V2, ...) or list of tuples
@@ -130,22 +150,29 @@ class PieceWiseLinear:
         if len(points) == 1 and isinstance(points[0], list):
             points = points[0]
 
-        # Allow list of tuples
-        if all(isinstance(p, tuple) and len(p) == 2 for p in points):
+        # Allow list of tuples; the first item decides the shape, and every
+        # item is checked while flattening
+        if points and isinstance(points[0], tuple):
             flat = []
-            for t, v in points:
-                flat.extend([fv(t), fv(v)])
-            self.points = flat
-        else:
-            if len(points) % 2 != 0:
-                raise ValueError("PieceWiseLinear points must be in (time, value) pairs.")
-            self.points = [fv(p) for p in points]
+            for point in points:
+                if not isinstance(point, tuple) or len(point) != 2:
+                    raise ValueError("PieceWiseLinear points must be in (time, value) pairs.")
+                flat += point
+            points = flat
+        elif len(points) % 2 != 0:
+            raise ValueError("PieceWiseLinear points must be in (time, value) pairs.")
+
+        # map() keeps the per-point loop in C; fv itself is cached
+        self.points = list(map(fv, points))
 
         self.r = fv(r) if r is not None else None
         self.td = fv(td) if td is not None else None
+        self._cached_str = None
 
-    def __str__(self):
-        base = "PieceWiseLinear(" + ' '.join(self.points) + ")"
+    def _render(self) -> str:
+        base = f"PieceWiseLinear({' '.join(self.points)})"
+        if self.r is None and self.td is None:
+            return base
         extras = []
         if self.r is not None:
             extras.append(f"r={self.r}")
@@ -153,7 +180,8 @@ class PieceWiseLinear:
             extras.append(f"td={self.td}")
         return base + (' ' + ' '.join(extras) if extras else "")
     
-class SingleFrequencyFM:
+class SingleFrequencyFM(_Waveform):
+    __slots__ = ('vo', 'va', 'fm', 'mdi', 'fc', 'td', 'phasem', 'phasec')
     def __init__(
         self,
         vo,         # Offset (V or A)
@@ -183,14 +211,16 @@ class SingleFrequencyFM:
         self.fm = fv(fm)
         self.mdi = fv(mdi)
         self.fc = fv(fc)
-        self.td = fv(td)
-        self.phasem = fv(phasem)
-        self.phasec = fv(phasec)
+        self.td = "0" if td == 0 else fv(td)
+        self.phasem = "0" if phasem == 0 else fv(phasem)
+        self.phasec = "0" if phasec == 0 else fv(phasec)
+        self._cached_str = None
 
-    def __str__(self):
+    def _render(self) -> str:
         return f"SFFM({self.vo} {self.va} {self.fm} {self.mdi} {self.fc} {self.td} {self.phasem} {self.phasec})"
     
-class AmplitudeModulationAM:
+class AmplitudeModulationAM(_Waveform):
+    __slots__ = ('vo', 'vmo', 'vma', 'fm', 'fc', 'td', 'phasem', 'phasec')
     def __init__(
         self,
         vo,         # Overall offset (V or A)
@@ -220,14 +250,17 @@ class AmplitudeModulationAM:
         self.vma = fv(vma)
         self.fm = fv(fm) if fm is not None else "5/TSTOP"  # default: 5 / TSTOP
         self.fc = fv(fc) if fc is not None else "500/TSTOP"  # default: 500 / TSTOP
-        self.td = fv(td)
-        self.phasem = fv(phasem)
-        self.phasec = fv(phasec)
+        self.td = "0" if td == 0 else fv(td)
+        self.phasem = "0" if phasem == 0 else fv(phasem)
+        self.phasec = "0" if phasec == 0 else fv(phasec)
+        self._cached_str = None
 
-    def __str__(self):
+    def _render(self) -> str:
         return f"AM({self.vo} {self.vmo} {self.vma} {self.fm} {self.fc} {self.td} {self.phasem} {self.phasec})"
     
-class TransientNoiseSource:
+class TransientNoiseSource(_Waveform):
+    __slots__ = ('na', 'nt', 'nalpha', 'namp', 'rtsam', 'rtscapt', 'rtsemt')
+
     def __init__(
         self,
         na=0,         # White noise RMS amplitude
@@ -250,18 +283,20 @@ class TransientNoiseSource:
             rtscapt (float|str): RTS trap capture time
             rtsemt (float|str): RTS trap emission time
         """
-        self.na = fv(na)
-        self.nt = fv(nt)
-        self.nalpha = fv(nalpha)
-        self.namp = fv(namp)
-        self.rtsam = fv(rtsam)
-        self.rtscapt = fv(rtscapt)
-        self.rtsemt = fv(rtsemt)
-
-    def __str__(self):
+        self.na = "0" if na == 0 else fv(na)
+        self.nt = "0" if nt == 0 else fv(nt)
+        self.nalpha = "0" if nalpha == 0 else fv(nalpha)
+        self.namp = "0" if namp == 0 else fv(namp)
+        self.rtsam = "0" if rtsam == 0 else fv(rtsam)
+        self.rtscapt = "0" if rtscapt == 0 else fv(rtscapt)
+        self.rtsemt = "0" if rtsemt == 0 else fv(rtsemt)
+        self._cached_str = None
+
+    def _render(self) -> str:
         return f"TRNOISE({self.na} {self.nt} {self.nalpha} {self.namp} {self.rtsam} {self.rtscapt} {self.rtsemt})"
     
-class RandomVoltage:
+class RandomVoltage(_Waveform):
+    __slots__ = ('rtype', 'ts', 'td', 'param1', 'param2')
     def __init__(
         self,
         rtype: int,        # 1 = uniform, 2 = gaussian, 3 = Exponentialonential, 4 = Poisson
@@ -288,16 +323,11 @@ class RandomVoltage:
         self.td = fv(td) if td is not None else None
         self.param1 = fv(param1) if param1 is not None else None
         self.param2 = fv(param2) if param2 is not None else None
+        self._cached_str = None
 
-    def __str__(self):
-        args = [self.rtype, self.ts]
-        if self.td is not None:
-            args.append(self.td)
-        if self.param1 is not None:
-            args.append(self.param1)
-        if self.param2 is not None:
-            args.append(self.param2)
-        return f"RandomVoltage({', '.join(args)})"
+    def _render(self) -> str:
+        # Fields are None or non-empty strings, so filter(None) drops exactly the unset ones
+        return f"RandomVoltage({', '.join(filter(None, (self.rtype, self.ts, self.td, self.param1, self.param2)))})"
     
 if __name__ == '__main__':
     from NgSpyce.Editor.Elements.Nodal.independent_source import VoltageSource
@@ -1,6 +1,8 @@
 from NgSpyce.utilities import format_value as fv
 
 class VoltageControlledSwitch:
+    __slots__ = ('name', 'nodes', 'control_nodes', 'model', '_state', '_state_suffix')
+
     def __init__(
         self,
         name: str,
@@ -23,18 +25,32 @@ class VoltageControlledSwitch:
             state (str, optional): Initial switch state: 'ON' or 'OFF'
         """
         self.name = name
-        self.nodes = [str(node1), str(node2)]
-        self.control_nodes = [str(control_node_pos), str(control_node_neg)]
+        self.nodes = (str(node1), str(node2))
+        self.control_nodes = (str(control_node_pos), str(control_node_neg))
         self.model = model
-        self.state = state.upper() if state else None
-        if self.state not in (None, "ON", "OFF"):
+        self.state = state
+
+    @property
+    def state(self):
+        return self._state
+
+    @state.setter
+    def state(self, state):
+        state = state.upper() if state else None
+        if state not in (None, "ON", "OFF"):
             raise ValueError("Switch state must be 'ON', 'OFF', or None")
+        self._state = state
+        # Precomputed so get_line needs no branch on the state
+        self._state_suffix = f" {state}" if state else ""
 
     def get_line(self):
-        parts = [self.name] + self.nodes + self.control_nodes + [self.model]
-        if self.state:
-            parts.append(self.state.upper())
-        return ' '.join(parts)
+        return (
+            f"{self.name} {self.nodes[0]} {self.nodes[1]} "
+            f"{self.control_nodes[0]} {self.control_nodes[1]} {self.model}{self._state_suffix}"
+        )
+
+    def write_to(self, buf) -> None:
+        buf.write(self.get_line())
 
 if __name__ == '__main__':
     s1 = VoltageControlledSwitch("S1", 10, 0, 1, 0, "switch1", state="off")
@@ -1,10 +1,12 @@
-import re
-from typing import Union
+import math
+import string
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Union
 
-import re
-from typing import Union
+# Anything format_value accepts: a number or a SPICE string such as "4.7k"
+SpiceValue = Union[str, int, float]
 
-METRIC_SUFFIXES = [
+METRIC_SUFFIXES = (
     ('T', 1e12),
     ('G', 1e9),
     ('Meg', 1e6),
@@ -16,9 +18,18 @@ METRIC_SUFFIXES = [
     ('p', 1e-12),
     ('f', 1e-15),
     ('a', 1e-18),
-]
+)
 
-# For parsing metric suffixes case-sensitively
+# METRIC_SUFFIXES split around 'mil', which format_value tests on its own
+_MIL_INDEX = [suffix for suffix, _ in METRIC_SUFFIXES].index('mil')
+_LARGE_SUFFIXES = METRIC_SUFFIXES[:_MIL_INDEX]
+_MIL_FACTOR = METRIC_SUFFIXES[_MIL_INDEX][1]
+_SMALL_SUFFIXES = METRIC_SUFFIXES[_MIL_INDEX + 1:]
+
+# Canonical spelling of each suffix, by factor ('k' and 'M' parse as 'K', 'Meg')
+_SUFFIX_BY_FACTOR = {factor: suffix for suffix, factor in METRIC_SUFFIXES}
+
+# For parsing metric suffixes (other letter cases are added below)
 PARSE_SUFFIX_MAP = {
     'T': 1e12,
     'G': 1e9,
@@ -35,51 +46,121 @@ PARSE_SUFFIX_MAP = {
     'a': 1e-18,
 }
 
-def normalize_value(val: Union[str, float, int]) -> float:
+# SPICE suffixes are case-insensitive. Single letters get their other case as
+# a key too, so the lookup needs no per-call case folding; 'M'/'m' are left
+# alone because they mean different things above.
+PARSE_SUFFIX_MAP.update({
+    suffix.swapcase(): factor
+    for suffix, factor in list(PARSE_SUFFIX_MAP.items())
+    if len(suffix) == 1 and suffix not in ('M', 'm')
+})
+
+# A SPICE value is a number followed by an optional run of ASCII letters (the
+# suffix). The suffix is split off the end and float() validates the rest.
+_SUFFIX_CHARS = string.ascii_letters
+
+class ParsedSpice(NamedTuple):
+    """A parsed SPICE value that keeps the suffix it was written with."""
+    value: float    # Full value, e.g. 4700.0 for "4.7k"
+    num: float      # Number in front of the suffix, e.g. 4.7
+    suffix: str     # Canonical suffix, e.g. 'K'; '' for a bare number
+
+def parse_spice(val: SpiceValue) -> ParsedSpice:
+    """Parse a SPICE metric string or number, keeping its suffix for format_value."""
+    if isinstance(val, (int, float)):
+        value = float(val)
+        return ParsedSpice(value, value, '')
+    return _parse_str(val)
+
+def normalize_value(val: SpiceValue) -> float:
     """Convert a SPICE metric string or number to float."""
     if isinstance(val, (int, float)):
         return float(val)
-    
+    return _parse_str(val).value
+
+def normalize_values(values: Iterable[SpiceValue]) -> List[float]:
+    """Convert many SPICE metric strings or numbers to floats in one call."""
+    # Same dispatch as normalize_value, inlined to save a frame per item
+    return [float(val) if isinstance(val, (int, float)) else _parse_str(val).value for val in values]
+
+# Component values repeat across a netlist ("10k", "1u"), so each distinct
+# string is parsed once.
+@lru_cache(maxsize=4096)
+def _parse_str(val: str) -> ParsedSpice:
     val = val.strip()
-    match = re.match(r'^([+-]?[\d.]+(?:[eE][+-]?\d+)?)([a-zA-Z]+)?$', val)
-    if not match:
+    num_str = val.rstrip(_SUFFIX_CHARS)
+    # A number always ends in a digit or '.'; this also rejects the trailing
+    # space in "1 k". float() would accept the underscore in "1_000".
+    if not num_str or num_str[-1] not in '0123456789.' or '_' in num_str:
         raise ValueError(f"Invalid SPICE format: '{val}'")
+    try:
+        num_part = float(num_str)
+    except ValueError:
+        raise ValueError(f"Invalid SPICE format: '{val}'") from None
+    if len(num_str) == len(val):
+        # Bare number ("3.3", "1000"), the common case: nothing to look up
+        return ParsedSpice(num_part, num_part, '')
 
-    num_part = float(match.group(1))
-    suffix = match.group(2)
+    suffix = val[len(num_str):]
 
-    if not suffix:
-        return num_part
-
-    suffix = suffix.strip()
+    # Exact-case lookup first: it covers every single-letter suffix
+    factor = PARSE_SUFFIX_MAP.get(suffix)
+    if factor is not None:
+        return ParsedSpice(num_part * factor, num_part, _SUFFIX_BY_FACTOR[factor])
 
     # Normalize special cases
-    if suffix.lower() == 'meg':
-        return num_part * PARSE_SUFFIX_MAP['Meg']
-    if suffix.lower() == 'mil':
-        return num_part * PARSE_SUFFIX_MAP['mil']
-    
-    if suffix in PARSE_SUFFIX_MAP:
-        return num_part * PARSE_SUFFIX_MAP[suffix]
+    lowered = suffix.lower()
+    if lowered == 'meg':
+        return ParsedSpice(num_part * PARSE_SUFFIX_MAP['Meg'], num_part, 'Meg')
+    if lowered == 'mil':
+        return ParsedSpice(num_part * PARSE_SUFFIX_MAP['mil'], num_part, 'mil')
 
     raise ValueError(f"Unknown metric suffix '{suffix}' in '{val}'")
 
-def format_value(val: Union[str, float, int], precision: int = 6) -> str:
+# Netlists reuse a small palette of values ("1k", "10n", 0), so repeats skip
+# the parse and the suffix search entirely. Strings that already look like
+# SPICE values are not passed through unparsed: "1k", "1M" and "1000" must
+# still come out as "1K", "1Meg" and "1K", and a cache hit is cheaper than
+# the regex test a pass-through would need.
+@lru_cache(maxsize=8192)
+def format_value(val: Union[SpiceValue, ParsedSpice], precision: int = 6) -> str:
     """Return the value formatted as canonical SPICE metric string."""
-    value = normalize_value(val)
+    if isinstance(val, (int, float)):
+        value = float(val)
+    elif isinstance(val, ParsedSpice):
+        # Already split into number and suffix: no suffix search needed
+        if val.suffix and val.num:
+            return f"{val.num:.{precision}g}{val.suffix}"
+        value = val.value
+    else:
+        value = _parse_str(val).value
 
     # Explicit zero: always format as "0"
     if value == 0:
         return "0"
 
-    for suffix, factor in METRIC_SUFFIXES:
+    for suffix, factor in _LARGE_SUFFIXES:
+        scaled = value / factor
+        if 0.1 <= abs(scaled) < 1e3:
+            return f"{scaled:.{precision}g}{suffix}"
+
+    # Must be a whole, non-zero number of mils to use mil. The test is done
+    # on the mil count itself; an absolute 1e-9 on the value was ~4e-5 mil
+    # wide and turned anything below ~1n into "0mil". Counts of a million
+    # and up are left to the plain fallback: past 2**53 every float is whole,
+    # so huge values would all "match".
+    scaled = value / _MIL_FACTOR
+    mils = round(scaled)
+    if mils and abs(scaled) < 1e6 and math.isclose(scaled, mils, rel_tol=1e-12, abs_tol=1e-9):
+        return f"{mils}mil"
+
+    for suffix, factor in _SMALL_SUFFIXES:
         scaled = value / factor
-        if suffix == 'mil':
-            # Must match exactly to use mil
-            if abs(value - factor * round(scaled)) < 1e-9:
-                return f"{int(round(scaled))}{suffix}"
-        elif 0.1 <= abs(scaled) < 1e3:
-            return f"{round(scaled, precision):g}{suffix}"
+        if abs(scaled) >= 1e3:
+            # Smaller factors only grow it further; no suffix fits
+            break
+        if abs(scaled) >= 0.1:
+            return f"{scaled:.{precision}g}{suffix}"
 
     return f"{value:.{precision}g}"
 
@@ -0,0 +1,79 @@
+"""
+Microbenchmark for netlist line rendering.
+
+Builds 10k each of Capacitor, Inductor and IndependentSource and reports,
+per element: construction time, first get_line() (the actual render) and
+repeated get_line() (the memoized path), plus the tracemalloc peak of the
+build-and-render pass. Use it to score changes to the nodal elements by
+wall time and allocation.
+
+Run from the repository root:
+
+    python -m scripts.bench_get_line [--reps N] [--profile]
+"""
+import argparse
+import cProfile
+import pstats
+import time
+import tracemalloc
+
+from NgSpyce.Editor.Elements.Nodal.capacitor import Capacitor
+from NgSpyce.Editor.Elements.Nodal.independent_source import IndependentSource
+from NgSpyce.Editor.Elements.Nodal.inductor import Inductor
+
+N = 10_000
+
+def build():
+    elems = [Capacitor(f"C{i}", i, i + 1, "1u", tc1="1e-3") for i in range(N)]
+    elems += [Inductor(f"L{i}", i, i + 1, "10u", tc1="1e-3") for i in range(N)]
+    elems += [IndependentSource(f"V{i}", i, 0, dc_value="5", ac_mag=1) for i in range(N)]
+    return elems
+
+def render(elems):
+    return sum(len(e.get_line()) for e in elems)
+
+def best_ns(func, reps):
+    best = None
+    for _ in range(reps):
+        start = time.perf_counter_ns()
+        func()
+        elapsed = time.perf_counter_ns() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--reps", type=int, default=100, help="repetitions per timing (default: 100)")
+    parser.add_argument("--profile", action="store_true", help="print a cProfile summary of build + render")
+    args = parser.parse_args()
+
+    count = 3 * N
+
+    # Every repetition times the full build and first render on fresh objects
+    build_ns = best_ns(build, args.reps)
+    first_ns = best_ns(lambda: render(build()), args.reps) - build_ns
+    elems = build()
+    render(elems)
+    repeat_ns = best_ns(lambda: render(elems), args.reps)
+
+    tracemalloc.start()
+    render(build())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"elements:         {count}")
+    print(f"construct:        {build_ns / count:8.1f} ns/element")
+    print(f"first get_line:   {first_ns / count:8.1f} ns/call")
+    print(f"repeat get_line:  {repeat_ns / count:8.1f} ns/call")
+    print(f"tracemalloc peak: {peak / 1024:8.1f} KiB")
+
+    if args.profile:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        render(build())
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+
+if __name__ == "__main__":
+    main()